@@ -96,6 +96,10 @@ pub struct RotatingFileConfig {
     /// Whether to truncate on size limit vs create numbered backups (default: true)
     #[serde(default = "default_truncate_on_limit")]
     pub truncate_on_limit: bool,
+    /// Whether to perform file writes on a background thread so logging
+    /// callers never block on disk I/O (default: false)
+    #[serde(default = "default_background_writer")]
+    pub background_writer: bool,
 }
 
 impl Default for Config {
@@ -157,6 +161,7 @@ impl Default for RotatingFileConfig {
             max_size_mb: default_max_size_mb(),
             console_output: default_console_output(),
             truncate_on_limit: default_truncate_on_limit(),
+            background_writer: default_background_writer(),
         }
     }
 }
@@ -166,12 +171,17 @@ fn default_info_threshold() -> usize { 50 }
 fn default_debug_threshold() -> usize { 100 }
 fn default_trace_threshold() -> usize { 200 }
 fn default_truncate() -> bool { true }
-fn default_log_directory() -> String { "logs".to_string() }
+fn default_log_directory() -> String {
+    // Lets deployments redirect logs (e.g. onto faster or larger storage)
+    // without editing config.yaml
+    std::env::var("AUTODEBUGGER_LOG_DIR").unwrap_or_else(|_| "logs".to_string())
+}
 fn default_log_filename() -> String { "app.log".to_string() }
 fn default_max_files() -> usize { 10 }
 fn default_max_size_mb() -> u64 { 5 }
 fn default_console_output() -> bool { true }
 fn default_truncate_on_limit() -> bool { true }
+fn default_background_writer() -> bool { false }
 fn default_remove_debug_paths() -> Vec<String> { 
     vec!["src".to_string(), "tests".to_string()] 
 }
@@ -186,20 +196,28 @@ fn default_ignore_patterns() -> Vec<String> {
 }
 
 impl Config {
+    /// Shared configuration, loaded once per process.
+    /// Repeated callers (CLI handlers, logging layers) get the same
+    /// instance instead of re-reading and re-parsing config.yaml.
+    pub fn cached() -> &'static Self {
+        static CONFIG: std::sync::OnceLock<Config> = std::sync::OnceLock::new();
+        CONFIG.get_or_init(|| Config::load().unwrap_or_default())
+    }
+
     /// Load configuration from file, or use defaults if not found
     pub fn load() -> Result<Self> {
-        // Try to load from config.yaml in current directory
-        let config_path = Path::new("config.yaml");
-        
-        if config_path.exists() {
-            let contents = fs::read_to_string(config_path)
-                .context("Failed to read config.yaml")?;
-            let config: Config = serde_yaml::from_str(&contents)
-                .context("Failed to parse config.yaml")?;
-            Ok(config)
-        } else {
+        // Try to load from config.yaml in current directory; reading
+        // directly and handling NotFound avoids a separate exists() stat
+        // and the race between checking and reading
+        match fs::read_to_string("config.yaml") {
+            Ok(contents) => {
+                let config: Config = serde_yaml::from_str(&contents)
+                    .context("Failed to parse config.yaml")?;
+                Ok(config)
+            }
             // Use defaults if no config file exists
-            Ok(Config::default())
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => Ok(Config::default()),
+            Err(e) => Err(e).context("Failed to read config.yaml"),
         }
     }
     
@@ -58,7 +58,6 @@
 //! ```
 
 use anyhow::{Context, Result};
-use cmd_lib::*;
 use serde::{Deserialize, Serialize};
 use std::path::PathBuf;
 use tracing::{error, info, trace};
@@ -117,63 +116,77 @@ impl Autodebugger {
     }
 
     pub fn run_command(&self, command: &str) -> Result<CommandResult> {
+        use std::process::Command;
+
         info!("Running command: {}", command);
 
-        std::env::set_current_dir(&self.working_dir)
-            .context("Failed to set working directory")?;
+        // current_dir scopes the working directory to the child process;
+        // set_current_dir would mutate it for the whole process, which
+        // races with any other thread running commands
+        let output = Command::new("bash")
+            .arg("-c")
+            .arg(command)
+            .current_dir(&self.working_dir)
+            .output()
+            .context("Failed to spawn command")?;
 
-        let result = run_fun!(bash -c $command);
+        Ok(Self::collect_result(output))
+    }
 
-        match result {
-            Ok(output) => {
-                trace!("Command succeeded with output: {}", output);
-                Ok(CommandResult {
-                    stdout: output,
-                    stderr: String::new(),
-                    exit_code: 0,
-                    success: true,
-                })
-            }
-            Err(e) => {
-                error!("Command failed: {}", e);
-                Ok(CommandResult {
-                    stdout: String::new(),
-                    stderr: e.to_string(),
-                    exit_code: 1,
-                    success: false,
-                })
-            }
+    /// Turn captured process output into a CommandResult, logging the
+    /// outcome at the appropriate level
+    fn collect_result(output: std::process::Output) -> CommandResult {
+        let stdout = String::from_utf8_lossy(&output.stdout).to_string();
+        let stderr = String::from_utf8_lossy(&output.stderr).to_string();
+
+        if output.status.success() {
+            trace!("Command succeeded with output: {}", stdout);
+        } else {
+            error!("Command failed: {}", stderr);
+        }
+
+        CommandResult {
+            stdout,
+            stderr,
+            exit_code: output.status.code().unwrap_or(1),
+            success: output.status.success(),
         }
     }
 
     pub fn run_command_with_input(&self, command: &str, input: &str) -> Result<CommandResult> {
-        info!("Running command with input: {}", command);
+        use std::io::Write;
+        use std::process::{Command, Stdio};
 
-        std::env::set_current_dir(&self.working_dir)
-            .context("Failed to set working directory")?;
+        info!("Running command with input: {}", command);
 
-        let result = run_fun!(echo $input | bash -c $command);
+        // Feed input through a piped stdin on a single bash process
+        // instead of spawning a separate echo in a pipeline; this also
+        // delivers the input verbatim rather than via shell expansion
+        let mut child = Command::new("bash")
+            .arg("-c")
+            .arg(command)
+            .current_dir(&self.working_dir)
+            .stdin(Stdio::piped())
+            .stdout(Stdio::piped())
+            .stderr(Stdio::piped())
+            .spawn()
+            .context("Failed to spawn command")?;
 
-        match result {
-            Ok(output) => {
-                trace!("Command succeeded with output: {}", output);
-                Ok(CommandResult {
-                    stdout: output,
-                    stderr: String::new(),
-                    exit_code: 0,
-                    success: true,
-                })
-            }
-            Err(e) => {
-                error!("Command failed: {}", e);
-                Ok(CommandResult {
-                    stdout: String::new(),
-                    stderr: e.to_string(),
-                    exit_code: 1,
-                    success: false,
-                })
+        {
+            let stdin = child.stdin.as_mut().context("Failed to open stdin")?;
+            stdin.write_all(input.as_bytes())
+                .context("Failed to write input to command")?;
+            // echo terminated the input with a newline; keep that contract
+            // for line-oriented consumers
+            if !input.ends_with('\n') {
+                stdin.write_all(b"\n").context("Failed to write input to command")?;
             }
         }
+
+        let output = child.wait_with_output()
+            .context("Failed to wait for command")?;
+
+        Ok(Self::collect_result(output))
     }
 
     pub fn run_commands_sequential(&self, commands: Vec<&str>) -> Result<Vec<CommandResult>> {
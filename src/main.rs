@@ -162,16 +162,38 @@ enum Commands {
 }
 
 
+/// Use explicitly provided paths, or fall back to the configured defaults
+fn paths_or_default(paths: Vec<PathBuf>, defaults: &[String]) -> Vec<PathBuf> {
+    if paths.is_empty() {
+        defaults.iter().map(PathBuf::from).collect()
+    } else {
+        paths
+    }
+}
+
+/// Serialize JSON output directly to stdout, avoiding an intermediate String
+fn print_json<T: serde::Serialize>(value: &T) -> Result<()> {
+    use std::io::Write;
+    let stdout = std::io::stdout();
+    let mut handle = stdout.lock();
+    serde_json::to_writer_pretty(&mut handle, value)?;
+    writeln!(handle)?;
+    Ok(())
+}
+
 #[tokio::main]
 async fn main() -> Result<()> {
+    // Parse args first: --help/--version and usage errors exit inside
+    // parse(), so they shouldn't pay for (or emit) any logging setup
+    let cli = Cli::parse();
+
     // Initialize autodebugger's tracing subscriber (using autodebugger's own config)
     // Using None for output defaults to stdout (normal behavior for non-MCP usage)
     let _verbosity_layer = init_logging(Some("info"), None, None);
-    
+
     info!("Autodebugger starting");
-    
-    let cli = Cli::parse();
-    
+
+
     match cli.command {
         Some(Commands::Monitor { path, format }) => {
             info!("Starting monitor for path: {}", path.display());
@@ -179,20 +201,25 @@ async fn main() -> Result<()> {
             let status = monitor.status()?;
             
             match format.as_str() {
-                "json" => println!("{}", serde_json::to_string_pretty(&status)?),
+                "json" => print_json(&status)?,
                 _ => {
-                    println!("Worktree Status Report");
-                    println!("====================");
+                    use std::fmt::Write;
+                    // Assemble the report in one buffer; println! per line
+                    // locks and flushes stdout on every call
+                    let mut out = String::new();
+                    writeln!(out, "Worktree Status Report")?;
+                    write!(out, "====================")?;
                     for (name, worktree) in &status.worktrees {
-                        println!("\n{}: {} ({})", name, worktree.status, worktree.branch);
+                        write!(out, "\n\n{}: {} ({})", name, worktree.status, worktree.branch)?;
                         if let Some(task) = &worktree.current_task {
-                            println!("  Current task: {}", task);
+                            write!(out, "\n  Current task: {}", task)?;
                         }
-                        println!("  Files changed: {}", worktree.files_changed);
+                        write!(out, "\n  Files changed: {}", worktree.files_changed)?;
                         if let Some(last) = &worktree.last_change {
-                            println!("  Last change: {}", last);
+                            write!(out, "\n  Last change: {}", last)?;
                         }
                     }
+                    println!("{}", out);
                 }
             }
         }
@@ -220,15 +247,18 @@ async fn main() -> Result<()> {
             let status = monitor.status()?;
             
             if json {
-                println!("{}", serde_json::to_string_pretty(&status)?);
+                print_json(&status)?;
             } else {
+                use std::fmt::Write;
+                let mut out = String::new();
                 for (name, worktree) in &status.worktrees {
-                    println!("{}: {} ({} files changed)", 
-                        name, 
+                    writeln!(out, "{}: {} ({} files changed)",
+                        name,
                         worktree.status,
                         worktree.files_changed
-                    );
+                    )?;
                 }
+                print!("{}", out);
             }
         }
         
@@ -250,15 +280,8 @@ async fn main() -> Result<()> {
         Some(Commands::RemoveDebug { paths, dry_run, verbose }) => {
             use autodebugger::config::Config;
             
-            // Use provided paths or fall back to config defaults
-            let paths_to_process = if paths.is_empty() {
-                let config = Config::load().unwrap_or_default();
-                config.remove_debug.default_paths.into_iter()
-                    .map(PathBuf::from)
-                    .collect()
-            } else {
-                paths
-            };
+            let paths_to_process =
+                paths_or_default(paths, &Config::cached().remove_debug.default_paths);
             
             if dry_run && verbose {
                 info!("Running in dry-run mode - no files will be modified");
@@ -297,16 +320,10 @@ async fn main() -> Result<()> {
             use autodebugger::validate_docs::DocValidator;
             
             // Load configuration
-            let config = Config::load().unwrap_or_default();
-            
-            // Use provided paths or fall back to config defaults
-            let paths_to_process = if paths.is_empty() {
-                config.validate_docs.default_paths.into_iter()
-                    .map(PathBuf::from)
-                    .collect()
-            } else {
-                paths
-            };
+            let config = Config::cached();
+
+            let paths_to_process =
+                paths_or_default(paths, &config.validate_docs.default_paths);
             
             if verbose {
                 info!("Validating documentation in specified paths");
@@ -317,7 +334,7 @@ async fn main() -> Result<()> {
                 .with_min_doc_lines(config.validate_docs.min_doc_lines_complex)
                 .with_max_doc_lines(config.validate_docs.max_doc_lines)
                 .with_complexity_threshold(config.validate_docs.complexity_threshold)
-                .with_ignore_patterns(config.validate_docs.ignore_patterns)?
+                .with_ignore_patterns(config.validate_docs.ignore_patterns.clone())?
                 .with_verbose(verbose)
                 .with_strict(strict);
             
@@ -1,24 +1,36 @@
 use anyhow::{Context, Result};
-use std::path::Path;
+use std::path::{Path, PathBuf};
 use std::process::Command;
 
-pub struct DiffTracker;
+pub struct DiffTracker {
+    /// The workspace's worktrees directory, joined once at construction
+    /// instead of on every query
+    worktrees_dir: PathBuf,
+}
 
 impl DiffTracker {
-    pub fn new() -> Self {
-        Self
+    pub fn new(workspace_path: &Path) -> Self {
+        Self {
+            worktrees_dir: workspace_path.join("worktrees"),
+        }
     }
-    
-    pub fn get_diff_for_worktree(&self, workspace_path: &Path, worktree_name: &str) -> Result<String> {
-        let worktree_path = workspace_path.join("worktrees").join(worktree_name);
-        
+
+    pub fn get_diff_for_worktree(&self, worktree_name: &str) -> Result<String> {
+        let worktree_path = self.worktrees_dir.join(worktree_name);
+
         if !worktree_path.exists() {
             anyhow::bail!("Worktree not found: {}", worktree_name);
         }
-        
+
+        self.diff_at_path(&worktree_path, worktree_name)
+    }
+
+    /// Diff a worktree whose path is already known to exist; callers that
+    /// just enumerated the directory skip the redundant exists() check
+    fn diff_at_path(&self, worktree_path: &Path, worktree_name: &str) -> Result<String> {
         // Get both staged and unstaged changes
-        let staged = self.get_staged_diff(&worktree_path)?;
-        let unstaged = self.get_unstaged_diff(&worktree_path)?;
+        let staged = self.get_staged_diff(worktree_path)?;
+        let unstaged = self.get_unstaged_diff(worktree_path)?;
         
         let mut result = format!("# Diff for worktree: {}\n\n", worktree_name);
         
@@ -41,46 +53,61 @@ impl DiffTracker {
         Ok(result)
     }
     
-    pub fn get_all_diffs(&self, workspace_path: &Path) -> Result<String> {
-        let worktrees_dir = workspace_path.join("worktrees");
-        if !worktrees_dir.exists() {
-            return Ok("No worktrees found.".to_string());
-        }
-        
-        let mut all_diffs = Vec::new();
-        
-        for entry in std::fs::read_dir(&worktrees_dir)? {
+    pub fn get_all_diffs(&self) -> Result<String> {
+        // Open the directory directly; a missing worktrees directory just
+        // means there is nothing to diff
+        let entries = match std::fs::read_dir(&self.worktrees_dir) {
+            Ok(entries) => entries,
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+                return Ok("No worktrees found.".to_string());
+            }
+            Err(e) => return Err(e.into()),
+        };
+
+        let mut all_diffs = String::new();
+
+        for entry in entries {
             let entry = entry?;
+
+            // file_type comes from the directory entry itself, avoiding a
+            // stat call per entry
+            if !entry.file_type()?.is_dir() {
+                continue;
+            }
             let path = entry.path();
-            
-            if path.is_dir() && path.join(".git").exists() {
+
+            if path.join(".git").exists() {
                 let name = path.file_name()
                     .and_then(|n| n.to_str())
                     .unwrap_or("unknown");
-                    
-                match self.get_diff_for_worktree(workspace_path, name) {
-                    Ok(diff) => all_diffs.push(diff),
-                    Err(e) => all_diffs.push(format!("# Error getting diff for {}: {}\n", name, e)),
+
+                if !all_diffs.is_empty() {
+                    all_diffs.push_str("\n---\n\n");
+                }
+                match self.diff_at_path(&path, name) {
+                    Ok(diff) => all_diffs.push_str(&diff),
+                    Err(e) => all_diffs.push_str(&format!("# Error getting diff for {}: {}\n", name, e)),
                 }
             }
         }
-        
-        Ok(all_diffs.join("\n---\n\n"))
+
+        Ok(all_diffs)
     }
     
     // Summary mode implementation pending
     // Should return: Added files, Modified files, Deleted files, Line counts
-    pub fn get_diff_summary(&self, workspace_path: &Path, worktree_name: &str) -> Result<String> {
-        let worktree_path = workspace_path.join("worktrees").join(worktree_name);
+    pub fn get_diff_summary(&self, worktree_name: &str) -> Result<String> {
+        let worktree_path = self.worktrees_dir.join(worktree_name);
         
         if !worktree_path.exists() {
             anyhow::bail!("Worktree not found: {}", worktree_name);
         }
         
-        // Get file status
+        // Get file status; --no-optional-locks avoids contending with any
+        // git process already running in the worktree
         let output = Command::new("git")
             .current_dir(&worktree_path)
-            .args(&["status", "--porcelain"])
+            .args(&["--no-optional-locks", "status", "--porcelain"])
             .output()
             .context("Failed to run git status")?;
             
@@ -90,17 +117,20 @@ impl DiffTracker {
         let mut deleted = Vec::new();
         
         for line in status_lines.lines() {
-            if line.len() < 3 {
+            // The two status columns are always single ASCII bytes, so
+            // match on them directly; string slicing would re-check UTF-8
+            // boundaries (and panic on a multibyte filename at the cut)
+            let bytes = line.as_bytes();
+            if bytes.len() < 4 {
                 continue;
             }
-            
-            let status = &line[0..2];
+
             let file = &line[3..];
-            
-            match status {
-                "A " | " A" | "??" => added.push(file),
-                "M " | " M" | "MM" => modified.push(file),
-                "D " | " D" => deleted.push(file),
+
+            match (bytes[0], bytes[1]) {
+                (b'A', b' ') | (b' ', b'A') | (b'?', b'?') => added.push(file),
+                (b'M', b' ') | (b' ', b'M') | (b'M', b'M') => modified.push(file),
+                (b'D', b' ') | (b' ', b'D') => deleted.push(file),
                 _ => {}
             }
         }
@@ -130,17 +160,25 @@ impl DiffTracker {
             .args(&["diff", "--cached"])
             .output()
             .context("Failed to get staged diff")?;
-            
-        Ok(String::from_utf8_lossy(&output.stdout).to_string())
+
+        Ok(Self::stdout_to_string(output.stdout))
     }
-    
+
     fn get_unstaged_diff(&self, path: &Path) -> Result<String> {
         let output = Command::new("git")
             .current_dir(path)
             .args(&["diff"])
             .output()
             .context("Failed to get unstaged diff")?;
-            
-        Ok(String::from_utf8_lossy(&output.stdout).to_string())
+
+        Ok(Self::stdout_to_string(output.stdout))
+    }
+
+    /// Reuse the captured stdout buffer when it's valid UTF-8 (the normal
+    /// case for git output); from_utf8_lossy would copy it unconditionally.
+    /// Only invalid output pays for the lossy re-encode.
+    fn stdout_to_string(stdout: Vec<u8>) -> String {
+        String::from_utf8(stdout)
+            .unwrap_or_else(|e| String::from_utf8_lossy(e.as_bytes()).into_owned())
     }
 }
\ No newline at end of file
@@ -1,7 +1,8 @@
 use anyhow::{Context, Result};
 use serde::{Deserialize, Serialize};
+use std::borrow::Cow;
 use std::path::PathBuf;
-use std::collections::HashMap;
+use std::collections::BTreeMap;
 
 pub mod worktree;
 pub mod diff;
@@ -11,7 +12,9 @@ use diff::DiffTracker;
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct MonitorStatus {
-    pub worktrees: HashMap<String, WorktreeStatus>,
+    /// Keyed by worktree name; a BTreeMap keeps reports and JSON output
+    /// in stable name order without sorting at print time
+    pub worktrees: BTreeMap<String, WorktreeStatus>,
     pub timestamp: String,
 }
 
@@ -19,7 +22,9 @@ pub struct MonitorStatus {
 pub struct WorktreeStatus {
     pub name: String,
     pub path: PathBuf,
-    pub status: String,
+    /// Borrowed for the fixed "active"/"idle" states so each worktree
+    /// doesn't allocate its own copy of the same literal
+    pub status: Cow<'static, str>,
     pub last_change: Option<String>,
     pub files_changed: usize,
     pub current_task: Option<String>,
@@ -27,18 +32,16 @@ pub struct WorktreeStatus {
 }
 
 pub struct Monitor {
-    workspace_path: PathBuf,
     worktree_monitor: WorktreeMonitor,
     diff_tracker: DiffTracker,
 }
 
 impl Monitor {
     pub fn new(workspace_path: PathBuf) -> Result<Self> {
-        let worktree_monitor = WorktreeMonitor::new(workspace_path.clone())?;
-        let diff_tracker = DiffTracker::new();
-        
+        let diff_tracker = DiffTracker::new(&workspace_path);
+        let worktree_monitor = WorktreeMonitor::new(workspace_path)?;
+
         Ok(Self {
-            workspace_path,
             worktree_monitor,
             diff_tracker,
         })
@@ -46,12 +49,11 @@ impl Monitor {
     
     pub fn status(&self) -> Result<MonitorStatus> {
         let worktrees = self.worktree_monitor.scan_worktrees()?;
-        let mut status_map = HashMap::new();
+        let mut status_map = BTreeMap::new();
         
         for worktree in worktrees {
-            let name = worktree.name.clone();
-            let worktree_status = self.worktree_monitor.get_status(&worktree)?;
-            status_map.insert(name, worktree_status);
+            let worktree_status = self.worktree_monitor.get_status(worktree)?;
+            status_map.insert(worktree_status.name.clone(), worktree_status);
         }
         
         Ok(MonitorStatus {
@@ -62,8 +64,8 @@ impl Monitor {
     
     pub fn diff(&self, worktree_name: Option<&str>) -> Result<String> {
         match worktree_name {
-            Some(name) => self.diff_tracker.get_diff_for_worktree(&self.workspace_path, name),
-            None => self.diff_tracker.get_all_diffs(&self.workspace_path),
+            Some(name) => self.diff_tracker.get_diff_for_worktree(name),
+            None => self.diff_tracker.get_all_diffs(),
         }
     }
     
@@ -77,17 +79,25 @@ impl Monitor {
     
     fn aggregate_local_tasks(&self) -> Result<String> {
         let worktrees = self.worktree_monitor.scan_worktrees()?;
-        let mut tasks = Vec::new();
-        
+        // Append each section into one buffer; collecting per-worktree
+        // strings just to join them would allocate the content twice
+        let mut tasks = String::new();
+
         for worktree in worktrees {
             let claude_local_path = worktree.path.join("CLAUDE.local.md");
-            if claude_local_path.exists() {
-                let content = std::fs::read_to_string(&claude_local_path)
-                    .context("Failed to read CLAUDE.local.md")?;
-                tasks.push(format!("## Worktree: {}\n\n{}", worktree.name, content));
+            // Read directly and treat a missing file as "no tasks" rather
+            // than stat-ing first; most worktrees don't have one
+            let content = match std::fs::read_to_string(&claude_local_path) {
+                Ok(content) => content,
+                Err(e) if e.kind() == std::io::ErrorKind::NotFound => continue,
+                Err(e) => return Err(e).context("Failed to read CLAUDE.local.md"),
+            };
+            if !tasks.is_empty() {
+                tasks.push_str("\n\n---\n\n");
             }
+            tasks.push_str(&format!("## Worktree: {}\n\n{}", worktree.name, content));
         }
-        
-        Ok(tasks.join("\n\n---\n\n"))
+
+        Ok(tasks)
     }
 }
\ No newline at end of file
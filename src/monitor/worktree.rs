@@ -1,6 +1,10 @@
 use anyhow::{Context, Result};
+use std::borrow::Cow;
+use std::cell::RefCell;
+use std::io::BufRead;
 use std::path::{Path, PathBuf};
 use std::process::Command;
+use std::time::SystemTime;
 use crate::monitor::WorktreeStatus;
 
 #[derive(Debug, Clone)]
@@ -11,6 +15,10 @@ pub struct Worktree {
 
 pub struct WorktreeMonitor {
     workspace_path: PathBuf,
+    /// Scan results keyed by the worktrees directory's mtime, so repeat
+    /// scans within one session skip the per-entry stat calls unless a
+    /// worktree was added or removed
+    scan_cache: RefCell<Option<(SystemTime, Vec<Worktree>)>>,
 }
 
 impl WorktreeMonitor {
@@ -18,50 +26,75 @@ impl WorktreeMonitor {
         if !workspace_path.exists() {
             anyhow::bail!("Workspace path does not exist: {}", workspace_path.display());
         }
-        Ok(Self { workspace_path })
+        Ok(Self {
+            workspace_path,
+            scan_cache: RefCell::new(None),
+        })
     }
-    
+
     pub fn scan_worktrees(&self) -> Result<Vec<Worktree>> {
         let worktrees_dir = self.workspace_path.join("worktrees");
-        if !worktrees_dir.exists() {
-            return Ok(Vec::new());
+
+        // Directory mtime changes when worktrees are added or removed;
+        // if it hasn't, reuse the previous scan. The metadata call doubles
+        // as the existence check - a missing directory means no worktrees
+        let mtime = match std::fs::metadata(&worktrees_dir) {
+            Ok(meta) => meta.modified().ok(),
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(Vec::new()),
+            Err(e) => return Err(e.into()),
+        };
+        if let (Some(mtime), Some((cached_mtime, cached))) = (mtime, self.scan_cache.borrow().as_ref()) {
+            if mtime == *cached_mtime {
+                return Ok(cached.clone());
+            }
         }
-        
+
         let mut worktrees = Vec::new();
-        
+
         for entry in std::fs::read_dir(&worktrees_dir)? {
             let entry = entry?;
-            let path = entry.path();
-            
-            if path.is_dir() {
+
+            // file_type comes from the directory entry itself, avoiding a
+            // stat call per entry
+            if entry.file_type()?.is_dir() {
+                let path = entry.path();
                 let name = path.file_name()
                     .and_then(|n| n.to_str())
                     .unwrap_or("unknown")
                     .to_string();
-                    
+
                 // Check if it's a git worktree
                 if path.join(".git").exists() {
                     worktrees.push(Worktree { name, path });
                 }
             }
         }
-        
+
+        if let Some(mtime) = mtime {
+            *self.scan_cache.borrow_mut() = Some((mtime, worktrees.clone()));
+        }
+
         Ok(worktrees)
     }
     
-    pub fn get_status(&self, worktree: &Worktree) -> Result<WorktreeStatus> {
+    pub fn get_status(&self, worktree: Worktree) -> Result<WorktreeStatus> {
         // Get git branch
         let branch = self.get_git_branch(&worktree.path)?;
         
-        // Get git status
+        // Get git status; --no-optional-locks keeps this read-only query
+        // from taking the index lock and stalling concurrent git operations
+        // in the worktree
         let git_status = Command::new("git")
             .current_dir(&worktree.path)
-            .args(&["status", "--porcelain"])
+            .args(&["--no-optional-locks", "status", "--porcelain"])
             .output()
             .context("Failed to run git status")?;
             
-        let files_changed = String::from_utf8_lossy(&git_status.stdout)
-            .lines()
+        // Count lines in the raw bytes; porcelain output is one line per
+        // file, so there's no need to copy it into a String first
+        let files_changed = git_status.stdout
+            .split(|&b| b == b'\n')
+            .filter(|line| !line.is_empty())
             .count();
             
         // Get last commit time
@@ -81,9 +114,9 @@ impl WorktreeMonitor {
         let current_task = self.extract_current_task(&worktree.path);
         
         Ok(WorktreeStatus {
-            name: worktree.name.clone(),
-            path: worktree.path.clone(),
-            status: if files_changed > 0 { "active".to_string() } else { "idle".to_string() },
+            name: worktree.name,
+            path: worktree.path,
+            status: if files_changed > 0 { Cow::Borrowed("active") } else { Cow::Borrowed("idle") },
             last_change,
             files_changed,
             current_task,
@@ -92,37 +125,68 @@ impl WorktreeMonitor {
     }
     
     fn get_git_branch(&self, path: &Path) -> Result<String> {
+        // Reading HEAD directly avoids spawning a git process per worktree;
+        // fall back to the subprocess for anything we can't parse
+        if let Some(branch) = Self::read_branch_from_head(path) {
+            return Ok(branch);
+        }
+
         let output = Command::new("git")
             .current_dir(path)
             .args(&["branch", "--show-current"])
             .output()
             .context("Failed to get git branch")?;
-            
+
         Ok(String::from_utf8_lossy(&output.stdout).trim().to_string())
     }
+
+    /// Resolve the current branch by reading .git/HEAD in-process.
+    /// Handles linked worktrees, where .git is a file containing a
+    /// `gitdir:` pointer. Returns None for detached HEAD or unexpected
+    /// layouts so the caller can fall back to git itself.
+    fn read_branch_from_head(path: &Path) -> Option<String> {
+        let git_path = path.join(".git");
+        let head_path = if git_path.is_file() {
+            let contents = std::fs::read_to_string(&git_path).ok()?;
+            let gitdir = contents.strip_prefix("gitdir:")?.trim();
+            Path::new(gitdir).join("HEAD")
+        } else {
+            git_path.join("HEAD")
+        };
+
+        let head = std::fs::read_to_string(head_path).ok()?;
+        head.trim()
+            .strip_prefix("ref: refs/heads/")
+            .map(|branch| branch.to_string())
+    }
     
     fn extract_current_task(&self, path: &Path) -> Option<String> {
         let claude_local = path.join("CLAUDE.local.md");
-        if !claude_local.exists() {
-            return None;
-        }
-        
-        // Simple extraction: look for first task in "## Specific Tasks" section
-        if let Ok(content) = std::fs::read_to_string(&claude_local) {
-            let lines: Vec<&str> = content.lines().collect();
-            let mut in_tasks = false;
-            
-            for line in lines {
-                if line.starts_with("## Specific Tasks") {
-                    in_tasks = true;
-                } else if in_tasks && line.starts_with("1.") {
-                    return Some(line.trim_start_matches("1.").trim().to_string());
-                } else if in_tasks && line.starts_with("##") {
-                    break; // End of tasks section
-                }
+
+        // Simple extraction: look for first task in "## Specific Tasks" section.
+        // Stream the file line by line so the scan stops (and stops reading)
+        // at the first task instead of slurping the whole file. Opening
+        // directly doubles as the existence check - no separate stat
+        let file = std::fs::File::open(&claude_local).ok()?;
+        let mut reader = std::io::BufReader::new(file);
+        let mut in_tasks = false;
+        let mut line = String::new();
+
+        loop {
+            line.clear();
+            if reader.read_line(&mut line).ok()? == 0 {
+                break;
+            }
+
+            if line.starts_with("## Specific Tasks") {
+                in_tasks = true;
+            } else if in_tasks && line.starts_with("1.") {
+                return Some(line.trim_start_matches("1.").trim().to_string());
+            } else if in_tasks && line.starts_with("##") {
+                break; // End of tasks section
             }
         }
-        
+
         None
     }
 }
\ No newline at end of file
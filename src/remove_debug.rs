@@ -60,9 +60,21 @@
 use anyhow::{Context, Result};
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::LazyLock;
 use tracing::{info, warn};
 use regex::Regex;
 
+/// Regex for simple, standalone debug! calls
+/// Matches lines that contain only whitespace, debug! (with optional tracing:: prefix), and its arguments
+/// Allows trailing comments after the semicolon
+static SIMPLE_DEBUG_RE: LazyLock<Regex> =
+    LazyLock::new(|| Regex::new(r"^\s*(?:tracing::)?debug!\s*\([^;]*\)\s*;\s*(?://.*)?$").unwrap());
+
+/// Regex to detect debug! anywhere in a line (for warning purposes)
+/// Also matches tracing::debug!
+static ANY_DEBUG_RE: LazyLock<Regex> =
+    LazyLock::new(|| Regex::new(r"(?:tracing::)?debug!\s*\(").unwrap());
+
 pub struct DebugRemover {
     /// Path to search for Rust files
     pub path: PathBuf,
@@ -95,12 +107,12 @@ impl DebugRemover {
     pub fn remove_debug_calls(&self) -> Result<RemovalReport> {
         let mut report = RemovalReport::default();
         
-        if self.path.is_file() {
-            self.process_file(&self.path, &mut report)?;
-        } else if self.path.is_dir() {
-            self.process_directory(&self.path, &mut report)?;
-        } else {
-            anyhow::bail!("Path does not exist: {}", self.path.display());
+        // One metadata call answers both file-or-directory questions;
+        // is_file()/is_dir() would each stat the path separately
+        match fs::metadata(&self.path) {
+            Ok(meta) if meta.is_file() => self.process_file(&self.path, &mut report)?,
+            Ok(meta) if meta.is_dir() => self.process_directory(&self.path, &mut report)?,
+            _ => anyhow::bail!("Path does not exist: {}", self.path.display()),
         }
         
         Ok(report)
@@ -111,8 +123,13 @@ impl DebugRemover {
             .into_iter()
             .filter_map(|e| e.ok())
         {
+            // walkdir already knows the entry's type; path.is_file() would
+            // stat each entry again
+            if !entry.file_type().is_file() {
+                continue;
+            }
             let path = entry.path();
-            if path.is_file() && path.extension().and_then(|s| s.to_str()) == Some("rs") {
+            if path.extension().and_then(|s| s.to_str()) == Some("rs") {
                 self.process_file(path, report)?;
             }
         }
@@ -122,7 +139,14 @@ impl DebugRemover {
     fn process_file(&self, path: &Path, report: &mut RemovalReport) -> Result<()> {
         let content = fs::read_to_string(path)
             .with_context(|| format!("Failed to read file: {}", path.display()))?;
-        
+
+        // Most files contain no debug! calls at all; one substring scan
+        // skips the line-by-line rewrite for them entirely
+        if !content.contains("debug!") {
+            report.files_scanned += 1;
+            return Ok(());
+        }
+
         let (new_content, file_report) = self.remove_debug_from_content(&content);
         
         if file_report.lines_removed > 0 {
@@ -141,6 +165,8 @@ impl DebugRemover {
             }
             
             if !self.dry_run {
+                // lines_removed > 0 guarantees the rewrite was materialized
+                let new_content = new_content.expect("rewrite exists when lines were removed");
                 fs::write(path, new_content)
                     .with_context(|| format!("Failed to write file: {}", path.display()))?;
             }
@@ -152,65 +178,91 @@ impl DebugRemover {
         Ok(())
     }
 
-    fn remove_debug_from_content(&self, content: &str) -> (String, FileReport) {
-        let mut new_lines = Vec::new();
+    /// Returns the rewritten content, or None when no lines were removed.
+    /// The output buffer is only allocated once the first removal happens;
+    /// the untouched prefix is copied verbatim at that point, so files that
+    /// merely warn (debug! in comments or mixed lines) cost no allocation.
+    fn remove_debug_from_content(&self, content: &str) -> (Option<String>, FileReport) {
+        let mut new_content: Option<String> = None;
         let mut report = FileReport::default();
-        
-        // Regex for simple, standalone debug! calls
-        // Matches lines that contain only whitespace, debug! (with optional tracing:: prefix), and its arguments
-        // Allows trailing comments after the semicolon
-        let simple_debug_re = Regex::new(r"^\s*(?:tracing::)?debug!\s*\([^;]*\)\s*;\s*(?://.*)?$").unwrap();
-        
-        // Regex to detect debug! anywhere in a line (for warning purposes)
-        // Also matches tracing::debug!
-        let any_debug_re = Regex::new(r"(?:tracing::)?debug!\s*\(").unwrap();
-        
+
         // Track if we're in a multiline comment
         let mut in_block_comment = false;
-        
-        for (line_num, line) in content.lines().enumerate() {
-            let line_number = line_num + 1;
-            
+
+        let mut line_number = 0;
+        let mut pos = 0;
+
+        while pos < content.len() {
+            line_number += 1;
+
+            // Slice the raw line including its terminator so kept lines are
+            // copied byte-for-byte (preserving \r\n and the final newline)
+            let line_end = content[pos..]
+                .find('\n')
+                .map(|i| pos + i + 1)
+                .unwrap_or(content.len());
+            let raw_line = &content[pos..line_end];
+            let line = raw_line.trim_end_matches(['\n', '\r']);
+            pos = line_end;
+
+            // Derive the per-line predicates once up front instead of
+            // re-trimming and re-scanning inside each branch
+            let trimmed = line.trim_start();
+            let is_line_comment = trimmed.starts_with("//");
+
             // Check for block comment boundaries
             if line.contains("/*") {
                 in_block_comment = true;
             }
-            
-            // Check if line contains debug!
-            if any_debug_re.is_match(line) {
+
+            // Cheap substring check rejects the common case before any
+            // regex machinery runs; both regexes require the literal "debug!"
+            let mut keep = true;
+            if line.contains("debug!") && ANY_DEBUG_RE.is_match(line) {
+                let is_simple = SIMPLE_DEBUG_RE.is_match(line);
+                let in_comment = in_block_comment || is_line_comment;
+
                 // Case 1: Line is entirely a simple debug! call - remove it
-                if simple_debug_re.is_match(line) && !in_block_comment && !line.trim_start().starts_with("//") {
+                if is_simple && !in_comment {
                     report.lines_removed += 1;
-                    continue; // Skip this line entirely
+                    keep = false;
+
+                    // First removal: allocate the output and copy over
+                    // everything kept so far, untouched
+                    if new_content.is_none() {
+                        let mut out = String::with_capacity(content.len());
+                        out.push_str(&content[..line_end - raw_line.len()]);
+                        new_content = Some(out);
+                    }
                 }
-                
                 // Case 2: debug! in a comment
-                if in_block_comment || line.trim_start().starts_with("//") {
+                else if in_comment {
                     report.warnings.push(Warning {
                         line_number,
-                        message: "debug! or tracing::debug! found in comment - skipping".to_string(),
+                        message: "debug! or tracing::debug! found in comment - skipping",
                     });
-                    new_lines.push(line.to_string());
                 }
                 // Case 3: debug! with other code on the same line
-                else if !simple_debug_re.is_match(line) {
+                else {
                     report.warnings.push(Warning {
                         line_number,
-                        message: "debug! or tracing::debug! found with other code on same line - skipping".to_string(),
+                        message: "debug! or tracing::debug! found with other code on same line - skipping",
                     });
-                    new_lines.push(line.to_string());
                 }
-            } else {
-                // No debug! on this line, keep it
-                new_lines.push(line.to_string());
             }
-            
+
+            if keep {
+                if let Some(out) = new_content.as_mut() {
+                    out.push_str(raw_line);
+                }
+            }
+
             if line.contains("*/") {
                 in_block_comment = false;
             }
         }
-        
-        (new_lines.join("\n"), report)
+
+        (new_content, report)
     }
 }
 
@@ -256,5 +308,7 @@ pub struct FileReport {
 #[derive(Debug)]
 pub struct Warning {
     pub line_number: usize,
-    pub message: String,
+    /// Static description; warnings come from a fixed set of cases, so
+    /// repeated occurrences share one string instead of allocating each time
+    pub message: &'static str,
 }
\ No newline at end of file
@@ -59,6 +59,7 @@
 //!     max_size_mb: 10,
 //!     console_output: true,
 //!     truncate_on_limit: true,
+//!     background_writer: false,
 //! };
 //!
 //! let _layer = init_logging_with_file(Some("info"), None, None, config);
@@ -83,9 +84,10 @@
 
 use crate::config::RotatingFileConfig;
 use std::fs;
-use std::io::Write;
+use std::io::{BufWriter, Write};
 use std::path::{Path, PathBuf};
-use std::sync::{Arc, Mutex};
+use std::sync::{mpsc, Arc, Mutex};
+use std::thread;
 use tracing_subscriber::fmt::MakeWriter;
 
 /// Builder for configuring the rotating file logger
@@ -124,6 +126,11 @@ impl RotatingFileLoggerBuilder {
         self
     }
 
+    pub fn with_background_writer(mut self, background: bool) -> Self {
+        self.config.background_writer = background;
+        self
+    }
+
     /// Build and initialize the rotating file logger
     /// Returns a guard that should be kept alive for the duration of logging
     pub fn build(self) -> Result<RotatingFileGuard, std::io::Error> {
@@ -149,29 +156,35 @@ impl RotatingFileLogger {
 
     /// Initialize the rotating file logger with given configuration
     fn initialize(config: RotatingFileConfig) -> Result<RotatingFileGuard, std::io::Error> {
-        // Create log directory if it doesn't exist
-        fs::create_dir_all(&config.log_directory)?;
-
-        // Create the rotating writer
-        let writer = RotatingWriter::new(config.clone())?;
-        let writer = Arc::new(Mutex::new(writer));
-
-        Ok(RotatingFileGuard { _writer: writer })
+        Ok(RotatingWriterWrapper::new(config)?.into_guard())
     }
 }
 
 /// Guard that keeps the rotating logger alive
-/// Drop this to stop logging to files
+/// Drop this to stop logging to files (joins the writer thread in
+/// background mode, flushing any pending output)
 pub struct RotatingFileGuard {
-    _writer: Arc<Mutex<RotatingWriter>>,
+    _writer: WriterBackend,
 }
 
 /// The actual rotating file writer
 struct RotatingWriter {
     config: RotatingFileConfig,
-    current_file: fs::File,
+    /// Buffered so each log line doesn't cost a write syscall; flushed
+    /// on rotation, on explicit flush, and when the writer is dropped
+    current_file: BufWriter<fs::File>,
     current_size: u64,
+    /// config.max_size_mb converted to bytes once, so the per-write
+    /// rotation check is a plain comparison
+    max_size_bytes: u64,
     log_path: PathBuf,
+    /// Computed once at construction; the latest symlink location never
+    /// changes, so rotations don't rebuild it from the config strings
+    latest_path: PathBuf,
+    /// Set once the size limit is reached in truncate mode so subsequent
+    /// writes bail out with a single comparison instead of re-checking
+    /// the limit and re-logging the warning on every call
+    limit_reached: bool,
 }
 
 impl RotatingWriter {
@@ -192,15 +205,23 @@ impl RotatingWriter {
             .write(true)
             .truncate(true)
             .open(&log_path)?;
-        
+
         // Get current file size
         let current_size = current_file.metadata()?.len();
 
+        let latest_filename = format!("{}_latest.log", base_name);
+        let latest_path = PathBuf::from(&config.log_directory).join(latest_filename);
+
+        let max_size_bytes = config.max_size_mb * 1024 * 1024;
+
         let writer = Self {
             config,
-            current_file,
+            current_file: BufWriter::new(current_file),
             current_size,
+            max_size_bytes,
             log_path,
+            latest_path,
+            limit_reached: false,
         };
         
         // Create initial symlink to current log file
@@ -217,13 +238,14 @@ impl RotatingWriter {
         // Rotate existing numbered files
         for i in (1..self.config.max_files).rev() {
             let old_path = self.log_path.with_extension(format!("log.{}", i));
-            let new_path = self.log_path.with_extension(format!("log.{}", i + 1));
-            
+
             if old_path.exists() {
                 if i + 1 >= self.config.max_files {
                     // Delete the oldest file if we're at max
                     fs::remove_file(&old_path)?;
                 } else {
+                    // Only build the rename target when it's actually needed
+                    let new_path = self.log_path.with_extension(format!("log.{}", i + 1));
                     fs::rename(&old_path, &new_path)?;
                 }
             }
@@ -234,12 +256,12 @@ impl RotatingWriter {
         fs::rename(&self.log_path, &backup_path)?;
 
         // Create new empty log file
-        self.current_file = fs::OpenOptions::new()
+        self.current_file = BufWriter::new(fs::OpenOptions::new()
             .create(true)
             .write(true)
             .truncate(true)
-            .open(&self.log_path)?;
-        
+            .open(&self.log_path)?);
+
         self.current_size = 0;
         
         // Update symlink to point to the new log file
@@ -249,19 +271,16 @@ impl RotatingWriter {
     }
 
     fn should_rotate(&self) -> bool {
-        self.current_size >= self.config.max_size_mb * 1024 * 1024
+        self.current_size >= self.max_size_bytes
     }
 
     /// Update the "latest" symlink/copy to point to the current log file
     fn update_latest_symlink(&self) -> std::io::Result<()> {
-        // Generate the latest symlink name based on the base filename
-        let base_name = self.config.filename.trim_end_matches(".log");
-        let latest_filename = format!("{}_latest.log", base_name);
-        let latest_path = PathBuf::from(&self.config.log_directory).join(&latest_filename);
-        
+        let latest_path = &self.latest_path;
+
         // Remove existing symlink/file if it exists
         if latest_path.exists() {
-            if let Err(e) = fs::remove_file(&latest_path) {
+            if let Err(e) = fs::remove_file(latest_path) {
                 tracing::warn!("Failed to remove existing latest symlink: {}", e);
                 return Ok(()); // Continue without failing
             }
@@ -276,15 +295,15 @@ impl RotatingWriter {
                 .and_then(|name| name.to_str())
                 .unwrap_or(&self.config.filename);
             let target_path = format!("timestamped/{}", target_filename);
-            if let Err(e) = symlink(&target_path, &latest_path) {
-                tracing::warn!("Failed to create symlink {}: {}", latest_filename, e);
+            if let Err(e) = symlink(&target_path, latest_path) {
+                tracing::warn!("Failed to create symlink {}: {}", latest_path.display(), e);
             }
         }
         
         #[cfg(windows)]
         {
-            if let Err(e) = fs::copy(&self.log_path, &latest_path) {
-                tracing::warn!("Failed to create latest copy {}: {}", latest_filename, e);
+            if let Err(e) = fs::copy(&self.log_path, latest_path) {
+                tracing::warn!("Failed to create latest copy {}: {}", latest_path.display(), e);
             }
         }
         
@@ -294,12 +313,19 @@ impl RotatingWriter {
 
 impl Write for RotatingWriter {
     fn write(&mut self, buf: &[u8]) -> std::io::Result<usize> {
+        // Fast path: once the limit has been hit in truncate mode, every
+        // subsequent write is a single boolean check
+        if self.limit_reached {
+            return Ok(buf.len()); // Pretend we wrote it to avoid errors
+        }
+
         // Check if we're at size limit
         if self.should_rotate() {
             if self.config.truncate_on_limit {
-                // Truncate mode: stop logging when limit is reached
+                // Truncate mode: stop logging when limit is reached (warn once)
+                self.limit_reached = true;
                 tracing::warn!("Log size limit reached ({}MB), stopping logging for this run", self.config.max_size_mb);
-                return Ok(buf.len()); // Pretend we wrote it to avoid errors
+                return Ok(buf.len());
             } else {
                 // Backup mode: rotate to numbered files
                 self.rotate()?;
@@ -316,20 +342,104 @@ impl Write for RotatingWriter {
     }
 }
 
+/// Commands sent to the background writer thread
+enum LogCommand {
+    Write(Vec<u8>),
+    Flush,
+}
+
+/// Handle to a dedicated thread that owns the RotatingWriter and drains
+/// queued log output, keeping file I/O off the logging caller's thread
+struct BackgroundWriter {
+    tx: Option<mpsc::Sender<LogCommand>>,
+    handle: Option<thread::JoinHandle<()>>,
+}
+
+impl BackgroundWriter {
+    fn spawn(mut writer: RotatingWriter) -> std::io::Result<Self> {
+        let (tx, rx) = mpsc::channel::<LogCommand>();
+        let handle = thread::Builder::new()
+            .name("autodebugger-log-writer".to_string())
+            .spawn(move || {
+                let mut batch: Vec<u8> = Vec::new();
+                while let Ok(cmd) = rx.recv() {
+                    // Coalesce everything already queued into one write so
+                    // a burst of log lines costs a single pass through the
+                    // rotating writer instead of one per line
+                    batch.clear();
+                    let mut flush = false;
+                    let mut next = Some(cmd);
+                    loop {
+                        match next {
+                            Some(LogCommand::Write(buf)) => batch.extend_from_slice(&buf),
+                            Some(LogCommand::Flush) => flush = true,
+                            None => break,
+                        }
+                        next = rx.try_recv().ok();
+                    }
+                    if !batch.is_empty() {
+                        let _ = writer.write_all(&batch);
+                    }
+                    if flush {
+                        let _ = writer.flush();
+                    }
+                }
+                // Channel closed: flush whatever is buffered before exiting
+                let _ = writer.flush();
+            })?;
+        Ok(Self {
+            tx: Some(tx),
+            handle: Some(handle),
+        })
+    }
+
+    fn send(&self, cmd: LogCommand) {
+        // If the writer thread has died there is nowhere to log the error;
+        // drop the message rather than panicking in the logging path
+        if let Some(tx) = &self.tx {
+            let _ = tx.send(cmd);
+        }
+    }
+}
+
+impl Drop for BackgroundWriter {
+    fn drop(&mut self) {
+        // Closing the channel lets the thread drain remaining messages,
+        // flush, and exit; join so pending output reaches disk
+        drop(self.tx.take());
+        if let Some(handle) = self.handle.take() {
+            let _ = handle.join();
+        }
+    }
+}
+
+/// Shared handle to the active writer, either locked in-line or behind
+/// the background writer thread
+#[derive(Clone)]
+enum WriterBackend {
+    Direct(Arc<Mutex<RotatingWriter>>),
+    Background(Arc<BackgroundWriter>),
+}
+
 /// Wrapper to implement MakeWriter that integrates with tracing subscriber
-pub struct RotatingWriterWrapper(Arc<Mutex<RotatingWriter>>);
+pub struct RotatingWriterWrapper(WriterBackend);
 
 impl RotatingWriterWrapper {
     /// Create a new rotating writer wrapper
     pub fn new(config: RotatingFileConfig) -> Result<Self, std::io::Error> {
-        // Create log directory if it doesn't exist
-        fs::create_dir_all(&config.log_directory)?;
-        
+        // RotatingWriter::new creates the timestamped/ subdirectory, and
+        // create_dir_all makes the parent log directory along with it -
+        // no need to create it here first
+        let background = config.background_writer;
         let writer = RotatingWriter::new(config)?;
-        let writer = Arc::new(Mutex::new(writer));
-        Ok(Self(writer))
+        let backend = if background {
+            WriterBackend::Background(Arc::new(BackgroundWriter::spawn(writer)?))
+        } else {
+            WriterBackend::Direct(Arc::new(Mutex::new(writer)))
+        };
+        Ok(Self(backend))
     }
-    
+
     /// Convert to a guard that keeps the writer alive
     pub fn into_guard(self) -> RotatingFileGuard {
         RotatingFileGuard { _writer: self.0 }
@@ -353,18 +463,30 @@ impl<'a> MakeWriter<'a> for RotatingWriterWrapper {
     }
 }
 
-/// Guard for thread-safe writing  
+/// Guard for thread-safe writing
 pub struct RotatingWriterGuard<'a> {
-    writer: Arc<Mutex<RotatingWriter>>,
+    writer: WriterBackend,
     _phantom: std::marker::PhantomData<&'a ()>,
 }
 
 impl<'a> Write for RotatingWriterGuard<'a> {
     fn write(&mut self, buf: &[u8]) -> std::io::Result<usize> {
-        self.writer.lock().unwrap().write(buf)
+        match &self.writer {
+            WriterBackend::Direct(writer) => writer.lock().unwrap().write(buf),
+            WriterBackend::Background(writer) => {
+                writer.send(LogCommand::Write(buf.to_vec()));
+                Ok(buf.len())
+            }
+        }
     }
 
     fn flush(&mut self) -> std::io::Result<()> {
-        self.writer.lock().unwrap().flush()
+        match &self.writer {
+            WriterBackend::Direct(writer) => writer.lock().unwrap().flush(),
+            WriterBackend::Background(writer) => {
+                writer.send(LogCommand::Flush);
+                Ok(())
+            }
+        }
     }
 }
\ No newline at end of file
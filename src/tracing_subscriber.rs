@@ -72,7 +72,7 @@
 //! - `verbosity.trace_threshold`: Maximum messages to log at TRACE level
 
 use std::sync::atomic::{AtomicUsize, Ordering};
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 use tracing::{Event, Level, Subscriber};
 use tracing_subscriber::fmt::format::Writer;
 use tracing_subscriber::fmt::{FmtContext, FormatEvent, FormatFields};
@@ -144,42 +144,80 @@ where
     }
 }
 
+// Indices into the per-level count array
+const ERROR_IDX: usize = 0;
+const WARN_IDX: usize = 1;
+const INFO_IDX: usize = 2;
+const DEBUG_IDX: usize = 3;
+const TRACE_IDX: usize = 4;
+
+/// Map a tracing level to its index in the count array
+fn level_index(level: &Level) -> usize {
+    match *level {
+        Level::ERROR => ERROR_IDX,
+        Level::WARN => WARN_IDX,
+        Level::INFO => INFO_IDX,
+        Level::DEBUG => DEBUG_IDX,
+        Level::TRACE => TRACE_IDX,
+    }
+}
+
 /// A tracing Layer that counts log events by level to detect excessive verbosity
 #[derive(Debug, Clone)]
 pub struct VerbosityCheckLayer {
-    error_count: Arc<AtomicUsize>,
-    warn_count: Arc<AtomicUsize>,
-    info_count: Arc<AtomicUsize>,
-    debug_count: Arc<AtomicUsize>,
-    trace_count: Arc<AtomicUsize>,
+    /// Per-level event counts in one shared allocation, indexed by
+    /// `level_index` - denser than five separate Arc'd counters
+    counts: Arc<[AtomicUsize; 5]>,
     configured_level: Level,
-    config: Config,
+    /// Threshold for the configured level, resolved once at construction;
+    /// None for WARN/ERROR which never trigger verbosity warnings
+    threshold: Option<usize>,
 }
 
 impl VerbosityCheckLayer {
     /// Create a new VerbosityCheckLayer with default config
     pub fn new() -> Self {
-        Self::with_config(Config::load().unwrap_or_default())
+        Self::with_config(Config::cached().clone())
     }
     
     /// Create a new VerbosityCheckLayer with custom config
     pub fn with_config(config: Config) -> Self {
         // Detect the configured log level from RUST_LOG or default to INFO
-        let configured_level = Self::detect_configured_level();
-        
+        Self::with_config_and_level(config, Self::detect_configured_level())
+    }
+
+    /// Create a new VerbosityCheckLayer with a known configured level,
+    /// skipping the RUST_LOG detection. Used by the init_logging entry
+    /// points, which take the level from the env filter they just built.
+    pub fn with_config_and_level(config: Config, configured_level: Level) -> Self {
         Self {
-            error_count: Arc::new(AtomicUsize::new(0)),
-            warn_count: Arc::new(AtomicUsize::new(0)),
-            info_count: Arc::new(AtomicUsize::new(0)),
-            debug_count: Arc::new(AtomicUsize::new(0)),
-            trace_count: Arc::new(AtomicUsize::new(0)),
+            counts: Arc::new(Default::default()),
             configured_level,
-            config,
+            threshold: Self::threshold_for(configured_level, &config),
+        }
+    }
+
+    /// Resolve the verbosity threshold for a configured level.
+    /// WARN and ERROR levels never trigger verbosity warnings.
+    fn threshold_for(level: Level, config: &Config) -> Option<usize> {
+        match level {
+            Level::TRACE => Some(config.verbosity.trace_threshold),
+            Level::DEBUG => Some(config.verbosity.debug_threshold),
+            Level::INFO => Some(config.verbosity.info_threshold),
+            Level::WARN | Level::ERROR => None,
         }
     }
     
-    /// Detect the configured log level from environment
+    /// Detect the configured log level from environment.
+    /// RUST_LOG doesn't change within a process, so the parse is done once
+    /// and memoized for subsequent layer constructions.
     fn detect_configured_level() -> Level {
+        static CONFIGURED_LEVEL: OnceLock<Level> = OnceLock::new();
+        *CONFIGURED_LEVEL.get_or_init(Self::parse_configured_level)
+    }
+
+    /// Parse the configured log level from RUST_LOG
+    fn parse_configured_level() -> Level {
         if let Ok(rust_log) = std::env::var("RUST_LOG") {
             let lower = rust_log.to_lowercase();
             if lower.contains("trace") {
@@ -202,43 +240,33 @@ impl VerbosityCheckLayer {
     
     /// Get the total count of all log events
     pub fn total_count(&self) -> usize {
-        self.error_count.load(Ordering::Relaxed)
-            + self.warn_count.load(Ordering::Relaxed)
-            + self.info_count.load(Ordering::Relaxed)
-            + self.debug_count.load(Ordering::Relaxed)
-            + self.trace_count.load(Ordering::Relaxed)
+        self.counts.iter().map(|c| c.load(Ordering::Relaxed)).sum()
     }
-    
+
     /// Get counts broken down by level
     pub fn counts_by_level(&self) -> LogCounts {
         LogCounts {
-            error: self.error_count.load(Ordering::Relaxed),
-            warn: self.warn_count.load(Ordering::Relaxed),
-            info: self.info_count.load(Ordering::Relaxed),
-            debug: self.debug_count.load(Ordering::Relaxed),
-            trace: self.trace_count.load(Ordering::Relaxed),
+            error: self.counts[ERROR_IDX].load(Ordering::Relaxed),
+            warn: self.counts[WARN_IDX].load(Ordering::Relaxed),
+            info: self.counts[INFO_IDX].load(Ordering::Relaxed),
+            debug: self.counts[DEBUG_IDX].load(Ordering::Relaxed),
+            trace: self.counts[TRACE_IDX].load(Ordering::Relaxed),
         }
     }
     
     /// Check if verbosity exceeds recommended thresholds
     pub fn check_verbosity(&self) -> Option<VerbosityWarning> {
-        // Only check thresholds for INFO, DEBUG, and TRACE levels
-        // WARN and ERROR levels should never trigger verbosity warnings
-        let threshold = match self.configured_level {
-            Level::TRACE => Some(self.config.verbosity.trace_threshold),
-            Level::DEBUG => Some(self.config.verbosity.debug_threshold),
-            Level::INFO => Some(self.config.verbosity.info_threshold),
-            Level::WARN | Level::ERROR => None, // No threshold for WARN/ERROR
-        };
-        
-        if let Some(threshold_value) = threshold {
-            let total = self.total_count();
+        if let Some(threshold_value) = self.threshold {
+            // Load the counters once and derive the total from that
+            // snapshot, rather than sweeping the atomics a second time
+            let counts = self.counts_by_level();
+            let total = counts.total();
             if total > threshold_value {
                 Some(VerbosityWarning {
                     total_count: total,
                     threshold: threshold_value,
                     configured_level: self.configured_level,
-                    counts: self.counts_by_level(),
+                    counts,
                 })
             } else {
                 None
@@ -290,15 +318,8 @@ where
     S: Subscriber,
 {
     fn on_event(&self, event: &Event<'_>, _ctx: Context<'_, S>) {
-        let level = event.metadata().level();
-        
-        match *level {
-            Level::ERROR => self.error_count.fetch_add(1, Ordering::Relaxed),
-            Level::WARN => self.warn_count.fetch_add(1, Ordering::Relaxed),
-            Level::INFO => self.info_count.fetch_add(1, Ordering::Relaxed),
-            Level::DEBUG => self.debug_count.fetch_add(1, Ordering::Relaxed),
-            Level::TRACE => self.trace_count.fetch_add(1, Ordering::Relaxed),
-        };
+        let idx = level_index(event.metadata().level());
+        self.counts[idx].fetch_add(1, Ordering::Relaxed);
     }
 }
 
@@ -312,6 +333,13 @@ pub struct LogCounts {
     pub trace: usize,
 }
 
+impl LogCounts {
+    /// Total events across all levels in this snapshot
+    pub fn total(&self) -> usize {
+        self.error + self.warn + self.info + self.debug + self.trace
+    }
+}
+
 /// Warning information when verbosity threshold is exceeded
 #[derive(Debug, Clone)]
 pub struct VerbosityWarning {
@@ -327,6 +355,43 @@ pub fn create_base_env_filter(default_level: &str) -> EnvFilter {
         .unwrap_or_else(|_| EnvFilter::new(default_level))
 }
 
+/// Read the effective log level straight from the env filter rather than
+/// re-parsing RUST_LOG with string heuristics; the filter already knows
+/// the most verbose level it will let through
+fn configured_level_of(env_filter: &EnvFilter) -> Level {
+    Layer::<tracing_subscriber::registry::Registry>::max_level_hint(env_filter)
+        .and_then(|hint| hint.into_level())
+        .unwrap_or(Level::INFO)
+}
+
+/// Build the verbosity layer for a known configured level, using custom
+/// thresholds when provided or autodebugger's own config otherwise
+fn build_verbosity_layer(
+    verbosity_config: Option<crate::config::VerbosityConfig>,
+    level: Level,
+) -> VerbosityCheckLayer {
+    match verbosity_config {
+        Some(config) => {
+            // Build a Config struct with the provided verbosity
+            let mut full_config = Config::default();
+            full_config.verbosity = config;
+            VerbosityCheckLayer::with_config_and_level(full_config, level)
+        }
+        None => VerbosityCheckLayer::with_config_and_level(Config::cached().clone(), level),
+    }
+}
+
+/// Resolve the console writer for the requested output destination.
+/// Defaults to stdout; "stderr" is required for MCP servers so stdout
+/// stays clean for JSON-RPC messages.
+fn console_writer(output: Option<&str>) -> tracing_subscriber::fmt::writer::BoxMakeWriter {
+    use tracing_subscriber::fmt::writer::BoxMakeWriter;
+    match output {
+        Some("stderr") => BoxMakeWriter::new(std::io::stderr),
+        _ => BoxMakeWriter::new(std::io::stdout),
+    }
+}
+
 /// Initialize the tracing subscriber with custom formatting and verbosity checking
 /// Returns a handle to the VerbosityCheckLayer for later checking
 /// 
@@ -342,43 +407,18 @@ pub fn init_logging(
 ) -> VerbosityCheckLayer {
     let default = default_level.unwrap_or("info");
     let env_filter = create_base_env_filter(default);
-    
-    // Create verbosity layer with custom config if provided
-    let verbosity_layer = match verbosity_config {
-        Some(config) => {
-            // Build a Config struct with the provided verbosity
-            let mut full_config = Config::default();
-            full_config.verbosity = config;
-            VerbosityCheckLayer::with_config(full_config)
-        },
-        None => VerbosityCheckLayer::new(),  // Use autodebugger's config
-    };
+
+    let verbosity_layer = build_verbosity_layer(verbosity_config, configured_level_of(&env_filter));
     let verbosity_clone = verbosity_layer.clone();
-    
-    // Determine output destination
-    // Default to stdout for normal operation, but allow override to stderr
-    // This is critical for MCP servers which must keep stdout clean for JSON-RPC messages
-    match output {
-        Some("stderr") => {
-            tracing_subscriber::registry()
-                .with(env_filter)
-                .with(tracing_subscriber::fmt::layer()
-                    .with_writer(std::io::stderr)
-                    .event_format(ConditionalLocationFormatter))
-                .with(verbosity_layer)
-                .init();
-        },
-        _ => {
-            tracing_subscriber::registry()
-                .with(env_filter)
-                .with(tracing_subscriber::fmt::layer()
-                    .with_writer(std::io::stdout)
-                    .event_format(ConditionalLocationFormatter))
-                .with(verbosity_layer)
-                .init();
-        }
-    }
-    
+
+    tracing_subscriber::registry()
+        .with(env_filter)
+        .with(tracing_subscriber::fmt::layer()
+            .with_writer(console_writer(output))
+            .event_format(ConditionalLocationFormatter))
+        .with(verbosity_layer)
+        .init();
+
     verbosity_clone
 }
 
@@ -399,80 +439,40 @@ pub fn init_logging_with_file(
 ) -> VerbosityCheckLayer {
     let default = default_level.unwrap_or("info");
     let env_filter = create_base_env_filter(default);
-    
-    // Clone verbosity config for potential fallback use
-    let verbosity_config_clone = verbosity_config.clone();
-    
-    // Create verbosity layer with custom config if provided
-    let verbosity_layer = match verbosity_config {
-        Some(config) => {
-            // Build a Config struct with the provided verbosity
-            let mut full_config = Config::default();
-            full_config.verbosity = config;
-            VerbosityCheckLayer::with_config(full_config)
-        },
-        None => VerbosityCheckLayer::new(),  // Use autodebugger's config
-    };
-    let verbosity_clone = verbosity_layer.clone();
-    
+
     // Store console_output flag before moving file_config
     let console_output = file_config.console_output;
-    
+
     // Try to create rotating file writer
-    match RotatingWriterWrapper::new(file_config) {
-        Ok(file_writer) => {
-            // Build logging configuration based on console_output flag
-            if console_output {
-                // Dual logging: console + file
-                match output {
-                    Some("stderr") => {
-                        // stderr + file
-                        tracing_subscriber::registry()
-                            .with(env_filter)
-                            .with(tracing_subscriber::fmt::layer()
-                                .with_writer(std::io::stderr)
-                                .event_format(ConditionalLocationFormatter))
-                            .with(tracing_subscriber::fmt::layer()
-                                .with_writer(file_writer)
-                                .with_ansi(false)
-                                .event_format(ConditionalLocationFormatter))
-                            .with(verbosity_layer)
-                            .init();
-                    },
-                    _ => {
-                        // stdout + file  
-                        tracing_subscriber::registry()
-                            .with(env_filter)
-                            .with(tracing_subscriber::fmt::layer()
-                                .with_writer(std::io::stdout)
-                                .event_format(ConditionalLocationFormatter))
-                            .with(tracing_subscriber::fmt::layer()
-                                .with_writer(file_writer)
-                                .with_ansi(false)
-                                .event_format(ConditionalLocationFormatter))
-                            .with(verbosity_layer)
-                            .init();
-                    }
-                }
-            } else {
-                // File only - no console output
-                tracing_subscriber::registry()
-                    .with(env_filter)
-                    .with(tracing_subscriber::fmt::layer()
-                        .with_writer(file_writer)
-                        .with_ansi(false)
-                        .event_format(ConditionalLocationFormatter))
-                    .with(verbosity_layer)
-                    .init();
-            }
-        },
+    let file_writer = match RotatingWriterWrapper::new(file_config) {
+        Ok(file_writer) => file_writer,
         Err(e) => {
             eprintln!("Failed to initialize file logging: {}", e);
             // Fall back to console-only logging (reuse original function)
-            return init_logging(default_level, verbosity_config_clone, output);
+            return init_logging(default_level, verbosity_config, output);
         }
-    }
-    
+    };
+
+    let verbosity_layer = build_verbosity_layer(verbosity_config, configured_level_of(&env_filter));
+    let verbosity_clone = verbosity_layer.clone();
+
+    // Console layer is optional; Option<Layer> is a no-op when None
+    let console_layer = console_output.then(|| {
+        tracing_subscriber::fmt::layer()
+            .with_writer(console_writer(output))
+            .event_format(ConditionalLocationFormatter)
+    });
+
+    tracing_subscriber::registry()
+        .with(env_filter)
+        .with(console_layer)
+        .with(tracing_subscriber::fmt::layer()
+            .with_writer(file_writer)
+            .with_ansi(false)
+            .event_format(ConditionalLocationFormatter))
+        .with(verbosity_layer)
+        .init();
+
     verbosity_clone
 }
 
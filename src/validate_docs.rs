@@ -108,6 +108,7 @@
 
 use anyhow::{Context, Result};
 use std::fs;
+use std::io::BufRead;
 use std::path::{Path, PathBuf};
 use tracing::warn;
 use walkdir::WalkDir;
@@ -184,19 +185,28 @@ impl DocValidator {
         self
     }
 
-    /// Validate documentation for all Rust files in the given paths
+    /// Validate documentation for all Rust files in the given paths.
+    /// Duplicate or nested paths (e.g. `src src/monitor`) are collapsed to
+    /// their outermost roots so no file is validated twice.
     pub fn validate_paths(&self, paths: Vec<PathBuf>) -> Result<ValidationReport> {
-        let mut report = ValidationReport::default();
+        let mut report = ValidationReport {
+            complexity_threshold: self.complexity_threshold,
+            ..ValidationReport::default()
+        };
 
-        for path in paths {
-            if path.is_file() {
-                if self.should_process_file(&path) {
-                    self.validate_file(&path, &mut report)?;
+        for path in dedup_nested_paths(paths) {
+            // One metadata call answers both file-or-directory questions;
+            // is_file()/is_dir() would each stat the path separately
+            match fs::metadata(&path) {
+                Ok(meta) if meta.is_file() => {
+                    if self.should_process_file(&path) {
+                        self.validate_file(&path, &mut report)?;
+                    }
                 }
-            } else if path.is_dir() {
-                self.validate_directory(&path, &mut report)?;
-            } else {
-                anyhow::bail!("Path does not exist: {}", path.display());
+                Ok(meta) if meta.is_dir() => {
+                    self.validate_directory(&path, &mut report)?;
+                }
+                _ => anyhow::bail!("Path does not exist: {}", path.display()),
             }
         }
 
@@ -227,8 +237,13 @@ impl DocValidator {
             .into_iter()
             .filter_map(|e| e.ok())
         {
+            // walkdir already knows the entry's type; path.is_file() would
+            // stat each entry again
+            if !entry.file_type().is_file() {
+                continue;
+            }
             let path = entry.path();
-            if path.is_file() && self.should_process_file(path) {
+            if self.should_process_file(path) {
                 self.validate_file(path, report)?;
             }
         }
@@ -237,12 +252,9 @@ impl DocValidator {
 
     /// Validate a single Rust file
     fn validate_file(&self, path: &Path, report: &mut ValidationReport) -> Result<()> {
-        let content = fs::read_to_string(path)
+        let (doc_lines, total_lines) = self.scan_file(path)
             .with_context(|| format!("Failed to read file: {}", path.display()))?;
 
-        let total_lines = content.lines().count();
-        let doc_lines = self.count_module_doc_lines(&content);
-
         report.files_scanned += 1;
 
         // Determine if this is a complex module
@@ -323,38 +335,46 @@ impl DocValidator {
         Ok(())
     }
 
-    /// Count the number of module-level documentation lines (//!) at the start of a file
-    fn count_module_doc_lines(&self, content: &str) -> usize {
+    /// Count module-level documentation lines (//!) at the start of a file
+    /// along with the total line count, in a single buffered pass that
+    /// never materializes the whole file in memory
+    fn scan_file(&self, path: &Path) -> Result<(usize, usize)> {
+        let file = fs::File::open(path)?;
+        let mut reader = std::io::BufReader::new(file);
+        let mut line = String::new();
+
         let mut doc_lines = 0;
+        let mut total_lines = 0;
         let mut in_doc_block = true;
 
-        for line in content.lines() {
-            let trimmed = line.trim();
-            
+        loop {
+            line.clear();
+            if reader.read_line(&mut line)? == 0 {
+                break;
+            }
+            total_lines += 1;
+
             if in_doc_block {
-                if trimmed.starts_with("//!") {
-                    doc_lines += 1;
-                } else if trimmed.is_empty() {
+                // The interesting prefixes are all ASCII, so classify each
+                // line with one match over its leading bytes instead of a
+                // cascade of starts_with scans
+                match line.trim().as_bytes() {
+                    // Module documentation
+                    [b'/', b'/', b'!', ..] => doc_lines += 1,
                     // Allow blank lines within documentation
-                    continue;
-                } else if trimmed.starts_with("#![") {
+                    [] => {}
                     // Allow module-level attributes (like #![allow(dead_code)])
                     // These are valid at the module level and don't break the doc block
-                    continue;
-                } else if trimmed.starts_with("//") {
+                    [b'#', b'!', b'[', ..] => {}
                     // Regular comments are allowed but don't count as docs
-                    continue;
-                } else {
+                    [b'/', b'/', ..] => {}
                     // First actual code line (use statements, structs, etc.) - stop counting
-                    in_doc_block = false;
+                    _ => in_doc_block = false,
                 }
-            } else {
-                // Once we've left the doc block, we're done
-                break;
             }
         }
 
-        doc_lines
+        Ok((doc_lines, total_lines))
     }
 }
 
@@ -367,11 +387,28 @@ pub struct FileInfo {
     pub is_complex: bool,
 }
 
+/// Collapse a path list to its outermost roots: sorting puts parents
+/// before the paths nested under them, so a path is kept only if no
+/// already-kept root contains it
+fn dedup_nested_paths(mut paths: Vec<PathBuf>) -> Vec<PathBuf> {
+    paths.sort();
+    let mut roots: Vec<PathBuf> = Vec::with_capacity(paths.len());
+    for path in paths {
+        if !roots.iter().any(|root| path.starts_with(root)) {
+            roots.push(path);
+        }
+    }
+    roots
+}
+
 /// Report from documentation validation
 #[derive(Debug, Default)]
 pub struct ValidationReport {
     pub files_scanned: usize,
     pub warnings: usize,
+    /// The complexity threshold the validator ran with, carried along so
+    /// the summary can report it
+    pub complexity_threshold: usize,
     pub complex_files_passed: Vec<FileInfo>,
     pub simple_files_skipped: Vec<FileInfo>,
     pub file_issues: Vec<(FileInfo, Vec<ValidationIssue>)>,
@@ -435,9 +472,9 @@ impl ValidationReport {
         }
         
         if verbose && !self.simple_files_skipped.is_empty() {
-            println!("\n⏭️  Skipped ({} simple modules under {} lines):", 
-                    self.simple_files_skipped.len(), 
-                    200); // TODO: get this from config
+            println!("\n⏭️  Skipped ({} simple modules under {} lines):",
+                    self.simple_files_skipped.len(),
+                    self.complexity_threshold);
             for file in &self.simple_files_skipped {
                 println!("  {} ({} lines)", file.path.display(), file.total_lines);
             }
@@ -1,22 +1,36 @@
 use autodebugger::AutoDebugger;
 
+// One test per command so failures are attributed precisely and the
+// cases can run in parallel
+
 #[test]
-fn test_basic_commands() -> anyhow::Result<()> {
+fn test_echo_command() -> anyhow::Result<()> {
     let debugger = AutoDebugger::new();
-    
-    // Test echo command
+
     let result = debugger.run_command("echo 'Hello, World!'")?;
     assert!(result.success);
     assert_eq!(result.stdout.trim(), "Hello, World!");
-    
-    // Test pwd command
+
+    Ok(())
+}
+
+#[test]
+fn test_pwd_command() -> anyhow::Result<()> {
+    let debugger = AutoDebugger::new();
+
     let result = debugger.run_command("pwd")?;
     assert!(result.success);
     assert!(!result.stdout.is_empty());
-    
-    // Test ls command
+
+    Ok(())
+}
+
+#[test]
+fn test_ls_command() -> anyhow::Result<()> {
+    let debugger = AutoDebugger::new();
+
     let result = debugger.run_command("ls")?;
     assert!(result.success);
-    
+
     Ok(())
-}
\ No newline at end of file
+}